@@ -1,52 +1,102 @@
 import spacy
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.metrics.pairwise import linear_kernel
 import numpy as np
-import json
+import orjson
 import os
 import sys
+from collections import OrderedDict
+from functools import lru_cache
+
+PREPROCESS_CACHE_SIZE = 100_000
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the Romanian spaCy model once per process"""
+    # Only lemmas are needed; the lemmatizer still relies on the tagger/morphologizer
+    return spacy.load("ro_core_news_lg", disable=["parser", "ner", "textcat"])
 
 class ArticleAnalyzer:
     def __init__(self):
         """Initialize NLP models"""
-        self.nlp = spacy.load("ro_core_news_lg")
-        self.vectorizer = TfidfVectorizer()
+        self.nlp = _get_nlp()
+        # Dampen frequent terms and add bigrams for short titles/descriptions;
+        # L2 rows make linear_kernel equal to cosine similarity
+        self.vectorizer = TfidfVectorizer(sublinear_tf=True, ngram_range=(1, 2), min_df=1, norm='l2')
+        # Raw text -> preprocessed text, shared across calls (least recently used first)
+        self._preprocessed = OrderedDict()
 
     def preprocess_text(self, text):
         """Clean and lemmatize text"""
-        doc = self.nlp(text.lower())
-        return " ".join([token.lemma_ for token in doc if not token.is_stop and not token.is_punct])
+        return self.preprocess_texts([text])[0]
+
+    def preprocess_texts(self, texts, batch_size=64):
+        """Clean and lemmatize a batch of texts, reusing previously processed ones"""
+        cache = self._preprocessed
+        batch = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            if text in cache:
+                cache.move_to_end(text)
+                batch[text] = cache[text]
+            else:
+                missing.append(text)
+        if missing:
+            docs = self.nlp.pipe((text.lower() for text in missing), batch_size=batch_size)
+            for text, doc in zip(missing, docs):
+                batch[text] = cache[text] = " ".join([token.lemma_ for token in doc if not token.is_stop and not token.is_punct])
+        # Evict only after this batch has been collected
+        while len(cache) > PREPROCESS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return [batch[text] for text in texts]
 
     def calculate_similarity(self, text1, text2):
         """Calculate cosine similarity between two texts using TF-IDF"""
         texts = [text1, text2]
         tfidf_matrix = self.vectorizer.fit_transform(texts)
-        return cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        return linear_kernel(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
 
     def find_similar_articles(self, input_text, articles, is_bad=False, threshold=0.1):
-        """Find articles similar to input text"""
+        """Find articles similar to input text
+
+        is_bad is either a single flag for all articles or a sequence/array
+        with one flag per article.
+        """
         results = []
-        preprocessed_input = self.preprocess_text(input_text)
-        
-        for article in articles:
-            # Combine title and description for better matching
-            article_text = f"{article.get('title', '')} {article.get('description', '')}"
-            if not article_text:
-                continue
-                
-            preprocessed_article = self.preprocess_text(article_text)
-            similarity = self.calculate_similarity(preprocessed_input, preprocessed_article)
-            
-            if similarity > threshold:
-                results.append({
-                    'title': article.get('title', ''),
-                    'link': article.get('link', ''),
-                    'description': article.get('description', ''),
-                    'similarity': similarity,
-                    'is_bad': is_bad
-                })
-        
+        if not articles:
+            return results
+
+        # Combine title and description for better matching
+        raw_texts = [input_text] + [
+            f"{article.get('title', '')} {article.get('description', '')}"
+            for article in articles
+        ]
+        preprocessed_input, *preprocessed_articles = self.preprocess_texts(raw_texts)
+        if not preprocessed_input:
+            return results
+
+        # Fit TF-IDF once over the whole corpus
+        try:
+            tfidf_matrix = self.vectorizer.fit_transform([preprocessed_input] + preprocessed_articles)
+        except ValueError:
+            # Empty vocabulary, nothing can match
+            return results
+        similarities = linear_kernel(tfidf_matrix[0:1], tfidf_matrix[1:]).ravel()
+
+        if np.ndim(is_bad) == 0:
+            is_bad = [is_bad] * len(articles)
+
+        for idx in np.where(similarities > threshold)[0]:
+            article = articles[idx]
+            results.append({
+                'title': article.get('title', ''),
+                'link': article.get('link', ''),
+                'description': article.get('description', ''),
+                'similarity': float(similarities[idx]),
+                'is_bad': is_bad[idx]
+            })
+
         return results
 
 def main():
@@ -66,15 +116,15 @@ def main():
     bad_articles = []
     
     try:
-        with open(good_articles_path, 'r', encoding='utf-8') as f:
-            good_articles = json.load(f)
+        with open(good_articles_path, 'rb') as f:
+            good_articles = orjson.loads(f.read())
         print(f"Loaded {len(good_articles)} good articles")
     except Exception as e:
         print(f"Error loading good articles: {e}")
     
     try:
-        with open(bad_articles_path, 'r', encoding='utf-8') as f:
-            bad_articles = json.load(f)
+        with open(bad_articles_path, 'rb') as f:
+            bad_articles = orjson.loads(f.read())
         print(f"Loaded {len(bad_articles)} bad articles")
     except Exception as e:
         print(f"Error loading bad articles: {e}")
@@ -85,34 +135,41 @@ def main():
     
     # Initialize analyzer and find similar articles
     analyzer = ArticleAnalyzer()
-    good_matches = analyzer.find_similar_articles(input_text, good_articles, is_bad=False)
-    bad_matches = analyzer.find_similar_articles(input_text, bad_articles, is_bad=True)
+    # Score both corpora in one pass so they share a single TF-IDF fit
+    is_bad_mask = [False] * len(good_articles) + [True] * len(bad_articles)
+    matches = analyzer.find_similar_articles(input_text, good_articles + bad_articles, is_bad=is_bad_mask)
+    good_matches = [match for match in matches if not match['is_bad']]
+    bad_matches = [match for match in matches if match['is_bad']]
     
     # Sort matches separately
     good_matches.sort(key=lambda x: x['similarity'], reverse=True)
     bad_matches.sort(key=lambda x: x['similarity'], reverse=True)
     
-    print(f"\nAnalizăm textul: '{input_text}'")
-    print(f"\nAm găsit {len(good_matches) + len(bad_matches)} articole relevante:")
-    
-    if good_matches:
-        print("\nArticole de informație verificată:")
-        for idx, article in enumerate(good_matches, 1):
-            print(f"\n{idx}. {article['title']}")
-            print(f"   Similaritate: {article['similarity']:.2f}")
-            print(f"   Link: {article['link']}")
-            print(f"   Descriere: {article['description']}")
+    # Build the report and write it in one go
+    lines = [
+        f"\nAnalizăm textul: '{input_text}'",
+        f"\nAm găsit {len(good_matches) + len(bad_matches)} articole relevante:"
+    ]
     
-    if bad_matches:
-        print("\nArticole de dezinformare:")
-        for idx, article in enumerate(bad_matches, 1):
-            print(f"\n{idx}. {article['title']}")
-            print(f"   Similaritate: {article['similarity']:.2f}")
-            print(f"   Link: {article['link']}")
-            print(f"   Descriere: {article['description']}")
+    for heading, section_matches in (
+        ("\nArticole de informație verificată:", good_matches),
+        ("\nArticole de dezinformare:", bad_matches)
+    ):
+        if not section_matches:
+            continue
+        lines.append(heading)
+        for idx, article in enumerate(section_matches, 1):
+            lines.extend([
+                f"\n{idx}. {article['title']}",
+                f"   Similaritate: {article['similarity']:.2f}",
+                f"   Link: {article['link']}",
+                f"   Descriere: {article['description']}"
+            ])
     
     if not good_matches and not bad_matches:
-        print("\nNu am găsit articole similare.")
+        lines.append("\nNu am găsit articole similare.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
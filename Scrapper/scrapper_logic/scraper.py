@@ -2,9 +2,10 @@
 Module for scraping and saving articles to result.json
 """
 
-import json
+import orjson
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from typing import Dict, Any, List
 from datetime import datetime
@@ -13,28 +14,38 @@ from datetime import datetime
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 RESULTS_FILE = os.path.join(CURRENT_DIR, "result.json")
 
+# Keep-alive session for this script's requests. Each scraper module runs
+# as a standalone script, so it keeps its own session instead of importing
+# the one in trusted_sources.py.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 def scrape_veridica() -> List[Dict[str, Any]]:
     """Scrapes articles from Veridica website."""
     try:
         # Make the request
-        response = requests.get("https://veridica.ro/category/fact-checking/", timeout=10)
+        response = _SESSION.get("https://veridica.ro/category/fact-checking/", timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         articles = []
-        for card in soup.find_all('div', class_='card'):
-            if not (image_link := card.find('a')):
+        # All cards from one scrape share the same timestamp
+        scraped_at = datetime.now().isoformat()
+        for card in soup.select('div.card'):
+            if not (image_link := card.select_one('a')):
                 continue
                 
             link = image_link.get('href', '')
-            image = image_link.find('img')
+            image = image_link.select_one('img')
             image_url = image.get('src', '') if image else ''
             
-            if not (title_elem := card.find('h5', class_='card-title')):
+            if not (title_elem := card.select_one('h5.card-title')):
                 continue
                 
-            title = title_elem.find('a').text.strip() if title_elem.find('a') else ''
-            description = card.find('p', class_='card-text').text.strip() if card.find('p', class_='card-text') else ''
+            title_anchor = title_elem.select_one('a')
+            title = title_anchor.text.strip() if title_anchor else ''
+            description_elem = card.select_one('p.card-text')
+            description = description_elem.text.strip() if description_elem else ''
             
             articles.append({
                 'title': title,
@@ -42,7 +53,7 @@ def scrape_veridica() -> List[Dict[str, Any]]:
                 'image_url': image_url,
                 'description': description,
                 'source': 'veridica',
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at
             })
         
         return articles
@@ -57,8 +68,8 @@ def scrape_veridica() -> List[Dict[str, Any]]:
 def save_articles(articles: List[Dict[str, Any]]) -> None:
     """Saves articles to result.json file."""
     try:
-        with open("result.json", 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        with open("result.json", 'wb') as f:
+            f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
         print(f"Successfully saved {len(articles)} articles to {RESULTS_FILE}")
     except Exception as e:
         print(f"Error saving articles: {str(e)}")
@@ -66,9 +77,9 @@ def save_articles(articles: List[Dict[str, Any]]) -> None:
 def load_articles() -> List[Dict[str, Any]]:
     """Loads articles from result.json file."""
     try:
-        with open(RESULTS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with open(RESULTS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         print(f"Error loading articles: {str(e)}")
         return []
 
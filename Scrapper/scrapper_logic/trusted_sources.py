@@ -3,13 +3,19 @@ Module for managing trusted sources for fact checking.
 Loads sources from a JSON configuration file.
 """
 
-import json
+import copy
+import orjson
 import os
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.metrics.pairwise import linear_kernel
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
@@ -27,28 +33,66 @@ except LookupError:
 
 # Initialize stemmer for Romanian
 stemmer = SnowballStemmer("romanian")
+# Stemming is deterministic per token and the vocabulary repeats heavily
+_stem_cached = lru_cache(maxsize=50_000)(stemmer.stem)
+
+# Romanian stopwords, built once at import
+_STOP_WORDS = frozenset(stopwords.words('romanian'))
+
+# Matches anything that is not a word character or whitespace
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Maps keyword lists to binary hashed bag-of-words rows for Jaccard overlap
+_KEYWORD_HASHER = HashingVectorizer(
+    analyzer=lambda keywords: keywords,
+    binary=True,
+    n_features=2**16,
+    norm=None,
+    alternate_sign=False
+)
 
 # Get the directory of the current file
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 TRUSTED_SOURCES_FILE = os.path.join(CURRENT_DIR, "trusted_sources.json")
 
+# Keep-alive session for this script's requests. Each scraper module runs
+# as a standalone script, so it keeps its own session instead of importing
+# the one in scraper.py.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+@lru_cache(maxsize=1)
+def _read_trusted_sources() -> Dict[str, Any]:
+    """
+    Reads and parses the trusted sources file. Errors propagate, so only
+    successful loads are cached.
+    """
+    with open(TRUSTED_SOURCES_FILE, 'rb') as f:
+        return orjson.loads(f.read())
+
 def load_trusted_sources() -> Dict[str, Any]:
     """
     Loads trusted sources from the JSON configuration file.
+    The parsed file is cached; call invalidate_trusted_sources_cache() to reload it.
     
     Returns:
-        Dict[str, Any]: Dictionary containing trusted sources configuration
+        Dict[str, Any]: Copy of the trusted sources configuration
     """
     try:
-        with open(TRUSTED_SOURCES_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return copy.deepcopy(_read_trusted_sources())
     except FileNotFoundError:
         print(f"Warning: Trusted sources file not found at {TRUSTED_SOURCES_FILE}")
         return {}
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: Invalid JSON in trusted sources file at {TRUSTED_SOURCES_FILE}")
         return {}
 
+def invalidate_trusted_sources_cache() -> None:
+    """
+    Clears the cached trusted sources so the next access re-reads the file.
+    """
+    _read_trusted_sources.cache_clear()
+
 def get_trusted_sources() -> Dict[str, Any]:
     """
     Returns the dictionary of trusted sources with their configurations.
@@ -70,6 +114,7 @@ def get_source_trust_level(source_name: str) -> float:
         return sources[source_name]["trust_level"]
     return 0.0
 
+@lru_cache(maxsize=100_000)
 def preprocess_text(text: str) -> str:
     """
     Preprocesses text for comparison.
@@ -80,17 +125,40 @@ def preprocess_text(text: str) -> str:
     Returns:
         str: Preprocessed text
     """
-    # Convert to lowercase
-    text = text.lower()
-    # Remove special characters
-    text = re.sub(r'[^\w\s]', '', text)
+    # Convert to lowercase and remove special characters
+    text = _PUNCT_RE.sub('', text.lower())
     # Remove extra whitespace
     text = ' '.join(text.split())
     return text
 
+def calculate_similarities(query: str, texts: List[str]) -> np.ndarray:
+    """
+    Calculates TF-IDF cosine similarity between a query and each of the texts.
+    The vectorizer is fitted once over the query and all texts.
+    
+    Args:
+        query (str): Text to compare against
+        texts (List[str]): Texts to score
+        
+    Returns:
+        np.ndarray: Similarity score (0.0 to 1.0) for each text
+    """
+    if not texts:
+        return np.zeros(0)
+    try:
+        tfidf_matrix = TfidfVectorizer(sublinear_tf=True, norm='l2').fit_transform([query] + texts)
+    except ValueError:
+        # Empty vocabulary, nothing to compare
+        return np.zeros(len(texts))
+    # Rows are L2-normalized, so the linear kernel is the cosine similarity
+    return linear_kernel(tfidf_matrix[0:1], tfidf_matrix[1:]).ravel()
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculates similarity between two texts.
+    Kept for API compatibility only; verify_veracity scores through
+    calculate_similarities. Fitting on just two texts gives degenerate IDF
+    weights, so prefer calculate_similarities when comparing against a corpus.
     
     Args:
         text1 (str): First text
@@ -99,7 +167,25 @@ def calculate_similarity(text1: str, text2: str) -> float:
     Returns:
         float: Similarity score (0.0 to 1.0)
     """
-    return SequenceMatcher(None, text1, text2).ratio()
+    return float(calculate_similarities(text1, [text2])[0])
+
+def calculate_keyword_overlaps(keywords: List[str], other_keywords: List[List[str]]) -> np.ndarray:
+    """
+    Calculates the Jaccard overlap between a keyword list and each of the others.
+    Keywords are hashed into a shared sparse space, so collisions are possible but rare.
+    
+    Args:
+        keywords (List[str]): Keywords to compare against
+        other_keywords (List[List[str]]): Keyword lists to score
+        
+    Returns:
+        np.ndarray: Overlap score (0.0 to 1.0) for each keyword list
+    """
+    keyword_matrix = _KEYWORD_HASHER.transform([keywords] + other_keywords)
+    inter = (keyword_matrix[0] @ keyword_matrix[1:].T).toarray().ravel()
+    sizes = np.asarray(keyword_matrix.sum(axis=1)).ravel()
+    union = sizes[0] + sizes[1:] - inter
+    return np.divide(inter, union, out=np.zeros(len(other_keywords)), where=union > 0)
 
 def extract_keywords(text: str) -> List[str]:
     """
@@ -113,11 +199,10 @@ def extract_keywords(text: str) -> List[str]:
     """
     # Tokenize and remove stopwords
     tokens = word_tokenize(text.lower())
-    stop_words = set(stopwords.words('romanian'))
-    filtered_tokens = [word for word in tokens if word not in stop_words]
+    filtered_tokens = [word for word in tokens if word not in _STOP_WORDS]
     
     # Stem words
-    stemmed_tokens = [stemmer.stem(token) for token in filtered_tokens]
+    stemmed_tokens = [_stem_cached(token) for token in filtered_tokens]
     
     return stemmed_tokens
 
@@ -143,21 +228,41 @@ def verify_veracity(input_text: str, articles: List[Dict[str, Any]]) -> Dict[str
         'verdict': 'unknown'
     }
     
+    # Preprocess article titles and descriptions the same way as the input
+    processed_texts = [
+        (preprocess_text(article['title']), preprocess_text(article['description']))
+        for article in articles
+    ]
+    
+    # Score all titles and descriptions in a single pass (interleaved per article)
+    similarities = calculate_similarities(
+        processed_input,
+        [text for pair in processed_texts for text in pair]
+    )
+    title_similarities = similarities[0::2]
+    desc_similarities = similarities[1::2]
+    
+    # Keyword overlap (Jaccard) over the combined article text
+    keyword_overlaps = calculate_keyword_overlaps(
+        input_keywords,
+        [extract_keywords(f"{processed_title} {processed_desc}") for processed_title, processed_desc in processed_texts]
+    )
+    
     # Analyze each article
-    for article in articles:
-        # Preprocess article text
-        processed_article = preprocess_text(article['title'] + ' ' + article['description'])
-        article_keywords = extract_keywords(processed_article)
-        
-        # Calculate similarity scores
-        title_similarity = calculate_similarity(processed_input, article['title'])
-        desc_similarity = calculate_similarity(processed_input, article['description'])
-        keyword_overlap = len(set(input_keywords) & set(article_keywords)) / len(set(input_keywords) | set(article_keywords))
+    for article, title_similarity, desc_similarity, keyword_overlap in zip(
+        articles, title_similarities, desc_similarities, keyword_overlaps
+    ):
+        title_similarity = float(title_similarity)
+        desc_similarity = float(desc_similarity)
+        keyword_overlap = float(keyword_overlap)
         
         # Calculate overall match score
         match_score = (title_similarity * 0.4 + desc_similarity * 0.4 + keyword_overlap * 0.2)
         
-        if match_score > 0.3:  # Threshold for considering a match
+        # Threshold for considering a match. This and the verdict bands below date
+        # from the SequenceMatcher scoring and have not been recalibrated for
+        # TF-IDF cosine, which sits near 0 for unrelated text.
+        if match_score > 0.3:
             results['matches'].append({
                 'article': article,
                 'match_score': match_score,
@@ -213,66 +318,72 @@ def scrape_source(source_name: str) -> Dict[str, Any]:
         base_url = "https://www.veridica.ro/stiri/romania"
         
         # Scrape all pages up to page 15
-        for page in range(1, 15):  # Pages 1 to 15
-            page_url = f"{base_url}?page={page}" if page > 1 else base_url
-            
-            # Make the request
-            response = requests.get(page_url)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all article cards
-            cards = soup.find_all('div', class_='card')
+        pages = range(1, 15)  # Pages 1 to 15
+        page_urls = [f"{base_url}?page={page}" if page > 1 else base_url for page in pages]
+        
+        # Fetch the pages concurrently; responses are consumed in page order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = executor.map(lambda page_url: _SESSION.get(page_url, timeout=10), page_urls)
             
-            if not cards:  # If no cards found, we've reached the last page
-                break
+            for page, response in zip(pages, responses):
+                response.raise_for_status()  # Raise an exception for bad status codes
                 
-            for card in cards:
-                # Get the article link and image
-                image_link = card.find('a')
-                if not image_link:
-                    continue
-                    
-                link = image_link.get('href', '')
-                image = image_link.find('img')
-                image_url = image.get('src', '') if image else ''
+                # Parse the HTML
+                soup = BeautifulSoup(response.content, 'lxml')
                 
-                # Get the article title
-                title_elem = card.find('h5', class_='card-title')
-                if not title_elem:
-                    continue
-                    
-                title = title_elem.find('a').text.strip() if title_elem.find('a') else ''
+                # Find all article cards
+                cards = soup.select('div.card')
                 
-                # Get the article description
-                description_elem = card.find('p', class_='card-text')
-                description = description_elem.text.strip() if description_elem else ''
-                
-                # Get the author and date
-                author_info = card.find('div', class_='col-10')
-                if author_info:
-                    author = author_info.find('strong').text.strip() if author_info.find('strong') else ''
-                    date = author_info.find('span', class_='text-muted').text.strip() if author_info.find('span', class_='text-muted') else ''
-                else:
-                    author = ''
-                    date = ''
+                if not cards:  # If no cards found, we've reached the last page
+                    break
+                    
+                for card in cards:
+                    # Get the article link and image
+                    image_link = card.select_one('a')
+                    if not image_link:
+                        continue
+                        
+                    link = image_link.get('href', '')
+                    image = image_link.select_one('img')
+                    image_url = image.get('src', '') if image else ''
+                    
+                    # Get the article title
+                    title_elem = card.select_one('h5.card-title')
+                    if not title_elem:
+                        continue
+                        
+                    title_anchor = title_elem.select_one('a')
+                    title = title_anchor.text.strip() if title_anchor else ''
+                    
+                    # Get the article description
+                    description_elem = card.select_one('p.card-text')
+                    description = description_elem.text.strip() if description_elem else ''
+                    
+                    # Get the author and date
+                    author_info = card.select_one('div.col-10')
+                    if author_info:
+                        author_elem = author_info.select_one('strong')
+                        author = author_elem.text.strip() if author_elem else ''
+                        date_elem = author_info.select_one('span.text-muted')
+                        date = date_elem.text.strip() if date_elem else ''
+                    else:
+                        author = ''
+                        date = ''
+                    
+                    all_articles.append({
+                        'title': title,
+                        'link': link,
+                        'image_url': image_url,
+                        'description': description,
+                        'author': author,
+                        'date': date
+                    })
                 
-                all_articles.append({
-                    'title': title,
-                    'link': link,
-                    'image_url': image_url,
-                    'description': description,
-                    'author': author,
-                    'date': date
-                })
-            
-            print(f"Scraped page {page} - Found {len(cards)} articles")
+                print(f"Scraped page {page} - Found {len(cards)} articles")
         
         # Save all articles to a file
-        with open('articles.json', 'w', encoding='utf-8') as f:
-            json.dump(all_articles, f, indent=2, ensure_ascii=False)
+        with open('articles.json', 'wb') as f:
+            f.write(orjson.dumps(all_articles, option=orjson.OPT_INDENT_2))
         
         return {
             'source': source_name,